@@ -23,20 +23,13 @@ def find_pyproject_root(start_path: Path) -> Path | None:
     return None
 
 
-def _load_pyproject_version(pyproject_path: Path) -> str:
+def _parse_pyproject_version(content: str) -> str:
     """
-    Read the version from pyproject.toml to keep development parity with the packaged build.
+    Extract project.version from pyproject.toml content, falling back to the default version.
     """
-    if not pyproject_path.is_file():
-        return _DEFAULT_VERSION
-
     try:
-        with pyproject_path.open("rb") as pyproject_file:
-            project = tomllib.load(pyproject_file)
-    except (tomllib.TOMLDecodeError, OSError):
-        return _DEFAULT_VERSION
-
-    if not isinstance(project, dict):
+        project = tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
         return _DEFAULT_VERSION
 
     project_table = project.get("project")
@@ -48,6 +41,21 @@ def _load_pyproject_version(pyproject_path: Path) -> str:
     return _DEFAULT_VERSION
 
 
+def _load_pyproject_version(pyproject_path: Path) -> str:
+    """
+    Read the version from pyproject.toml to keep development parity with the packaged build.
+    """
+    if not pyproject_path.is_file():
+        return _DEFAULT_VERSION
+
+    try:
+        content = pyproject_path.read_text(encoding="utf-8")
+    except OSError:
+        return _DEFAULT_VERSION
+
+    return _parse_pyproject_version(content)
+
+
 def _resolve_app_version(pyproject_path: Path | None = None) -> str:
     """
     Prefer the installed package metadata, falling back to pyproject.toml when running from source.
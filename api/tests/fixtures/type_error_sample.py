@@ -0,0 +1,5 @@
+"""Intentionally ill-typed module used by the mypy type-error detection contract."""
+
+
+def test_function() -> int:
+    return "this is a string, not an int"  # Type error
@@ -0,0 +1,5 @@
+"""Shared constants for tests."""
+
+# Fixed placeholder IDs; the code under test only compares them, never looks them up
+TENANT_ID = "00000000-0000-0000-0000-000000000001"
+ACTOR_ID = "00000000-0000-0000-0000-000000000002"
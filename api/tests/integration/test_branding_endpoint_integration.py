@@ -1,6 +1,3 @@
-import os
-from unittest.mock import patch
-
 import pytest
 from src.api.endpoints.branding import (
     DEFAULT_APPLE_TOUCH_ICON_URL,
@@ -12,20 +9,15 @@ from src.core.config import get_settings, reset_settings_async
 
 
 @pytest.mark.asyncio
-async def test_branding_endpoint_returns_defaults(async_client) -> None:
-    with patch.dict(
-        os.environ,
-        {
-            "BRANDING_APPLICATION_TITLE": "",
-            "BRANDING_FAVICON_URL": "",
-            "BRANDING_APPLE_TOUCH_ICON_URL": "",
-            "BRANDING_MANIFEST_URL": "",
-            "BRANDING_ENVIRONMENT_SUFFIX": "",
-        },
-        clear=False,
-    ):
-        await reset_settings_async()
-        response = await async_client.get("/branding")
+async def test_branding_endpoint_returns_defaults(async_client, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BRANDING_APPLICATION_TITLE", "")
+    monkeypatch.setenv("BRANDING_FAVICON_URL", "")
+    monkeypatch.setenv("BRANDING_APPLE_TOUCH_ICON_URL", "")
+    monkeypatch.setenv("BRANDING_MANIFEST_URL", "")
+    monkeypatch.setenv("BRANDING_ENVIRONMENT_SUFFIX", "")
+
+    await reset_settings_async()
+    response = await async_client.get("/branding")
 
     assert response.status_code == 200
 
@@ -42,20 +34,15 @@ async def test_branding_endpoint_returns_defaults(async_client) -> None:
 
 
 @pytest.mark.asyncio
-async def test_branding_endpoint_applies_overrides(async_client) -> None:
-    with patch.dict(
-        os.environ,
-        {
-            "BRANDING_APPLICATION_TITLE": "Custom Title",
-            "BRANDING_FAVICON_URL": "/custom.ico",
-            "BRANDING_APPLE_TOUCH_ICON_URL": "/custom-touch.png",
-            "BRANDING_MANIFEST_URL": "/custom.webmanifest",
-            "BRANDING_ENVIRONMENT_SUFFIX": "Preview",
-        },
-        clear=False,
-    ):
-        await reset_settings_async()
-        response = await async_client.get("/branding")
+async def test_branding_endpoint_applies_overrides(async_client, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BRANDING_APPLICATION_TITLE", "Custom Title")
+    monkeypatch.setenv("BRANDING_FAVICON_URL", "/custom.ico")
+    monkeypatch.setenv("BRANDING_APPLE_TOUCH_ICON_URL", "/custom-touch.png")
+    monkeypatch.setenv("BRANDING_MANIFEST_URL", "/custom.webmanifest")
+    monkeypatch.setenv("BRANDING_ENVIRONMENT_SUFFIX", "Preview")
+
+    await reset_settings_async()
+    response = await async_client.get("/branding")
 
     assert response.status_code == 200
 
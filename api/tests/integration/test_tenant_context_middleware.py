@@ -3,10 +3,20 @@ Tests for tenant context middleware validation.
 """
 
 import uuid
+from collections.abc import Generator
 
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(scope="module")
+def client(app: FastAPI) -> Generator[TestClient, None, None]:
+    """Module-wide client; none of these tests mutate application state."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 def test_tenant_query_param_rejected(client: TestClient) -> None:
     """Query parameters must not supply tenant identifiers."""
     response = client.get("/health", params={"tenant_id": "123"})
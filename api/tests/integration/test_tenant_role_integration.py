@@ -2,18 +2,23 @@
 Integration-style tests to verify middleware + role dependencies work together.
 """
 
-import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from typing import Annotated, Any
 
+import httpx
+import pytest
+import pytest_asyncio
 from fastapi import Depends, FastAPI
-from fastapi.testclient import TestClient
 from src.api.deps import get_current_tenant, get_db_session, require_tenant_role
 from src.middleware.error_handler import setup_error_handling
 from src.middleware.tenant_context import TenantContextMiddleware
 from src.models.tenant import Tenant, TenantMember, TenantMemberRole, TenantMemberStatus
+from tests.helpers import ACTOR_ID, TENANT_ID
 
 
 class _StubResult:
+    __slots__ = ("_member",)
+
     def __init__(self, member: TenantMember | None) -> None:
         self._member = member
 
@@ -22,16 +27,22 @@ class _StubResult:
 
 
 class _StubSession:
+    __slots__ = ("_result",)
+
     def __init__(self, member: TenantMember | None) -> None:
-        self._member = member
+        # The member never changes for a session, so one result serves every execute()
+        self._result = _StubResult(member)
 
     async def execute(self, _statement: Any) -> _StubResult:
-        return _StubResult(self._member)
+        return self._result
+
+
+SessionOverride = Callable[[], Awaitable[_StubSession]]
 
 
 def _build_tenant() -> Tenant:
     tenant = Tenant(name="Test Tenant", slug="test-tenant")
-    tenant.id = str(uuid.uuid4())
+    tenant.id = TENANT_ID
     return tenant
 
 
@@ -44,15 +55,14 @@ def _build_member(user_id: str, tenant_id: str, role: TenantMemberRole) -> Tenan
     )
 
 
-def _create_app(member: TenantMember | None) -> TestClient:
+@pytest.fixture(scope="module")
+def role_app() -> FastAPI:
+    """App with the tenant middleware and an owner-only route, built once for the module."""
     tenant = _build_tenant()
 
     async def override_current_tenant() -> Tenant:
         return tenant
 
-    async def override_session() -> _StubSession:
-        return _StubSession(member)
-
     app = FastAPI()
     app.add_middleware(TenantContextMiddleware)
     setup_error_handling(app)
@@ -66,61 +76,102 @@ def _create_app(member: TenantMember | None) -> TestClient:
         return {"status": "ok"}
 
     app.dependency_overrides[get_current_tenant] = override_current_tenant
-    app.dependency_overrides[get_db_session] = override_session
 
-    return TestClient(app)
+    return app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_client(role_app: FastAPI) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Single async client for the module's role checks, calling the app over ASGI directly."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=role_app), base_url="http://test") as test_client:
+        yield test_client
+
+
+def _session_override(role: TenantMemberRole | None) -> SessionOverride:
+    """Build one stub session for the role and a parameterless dependency returning it."""
+    stub = _StubSession(None if role is None else _build_member(ACTOR_ID, TENANT_ID, role=role))
+
+    async def override_session() -> _StubSession:
+        return stub
+
+    return override_session
+
+
+@pytest.fixture(scope="module")
+def session_overrides() -> dict[TenantMemberRole | None, SessionOverride]:
+    """Session overrides for no membership and each role the tests use, built once."""
+    return {role: _session_override(role) for role in (None, TenantMemberRole.MEMBER, TenantMemberRole.OWNER)}
+
+
+@pytest.fixture
+def set_member_role(
+    role_app: FastAPI, session_overrides: dict[TenantMemberRole | None, SessionOverride]
+) -> Generator[Callable[[TenantMemberRole | None], None], None, None]:
+    """Point the session override at the prebuilt stub for a role, or for no membership."""
+
+    def _set_member_role(role: TenantMemberRole | None) -> None:
+        role_app.dependency_overrides[get_db_session] = session_overrides[role]
+
+    yield _set_member_role
+    role_app.dependency_overrides.pop(get_db_session, None)
 
 
-def test_missing_actor_header_returns_unauthorized() -> None:
-    client = _create_app(member=None)
-    headers = {"x-tenant-id": str(uuid.uuid4())}
+@pytest.mark.asyncio(loop_scope="module")
+async def test_missing_actor_header_returns_unauthorized(
+    async_client: httpx.AsyncClient, set_member_role: Callable[[TenantMemberRole | None], None]
+) -> None:
+    set_member_role(None)
+    headers = {"x-tenant-id": TENANT_ID}
 
-    response = client.get("/protected", headers=headers)
+    response = await async_client.get("/protected", headers=headers)
 
     assert response.status_code == 401
     assert response.json()["detail"] == "Actor context is required"
 
 
-def test_non_member_returns_forbidden() -> None:
-    client = _create_app(member=None)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_non_member_returns_forbidden(
+    async_client: httpx.AsyncClient, set_member_role: Callable[[TenantMemberRole | None], None]
+) -> None:
+    set_member_role(None)
     headers = {
-        "x-tenant-id": str(uuid.uuid4()),
-        "x-actor-id": str(uuid.uuid4()),
+        "x-tenant-id": TENANT_ID,
+        "x-actor-id": ACTOR_ID,
     }
 
-    response = client.get("/protected", headers=headers)
+    response = await async_client.get("/protected", headers=headers)
 
     assert response.status_code == 403
     assert response.json()["detail"] == "User is not a member of this tenant"
 
 
-def test_insufficient_role_returns_forbidden() -> None:
-    actor_id = str(uuid.uuid4())
-    tenant_id = str(uuid.uuid4())
-    member = _build_member(actor_id, tenant_id, role=TenantMemberRole.MEMBER)
-    client = _create_app(member=member)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_insufficient_role_returns_forbidden(
+    async_client: httpx.AsyncClient, set_member_role: Callable[[TenantMemberRole | None], None]
+) -> None:
+    set_member_role(TenantMemberRole.MEMBER)
     headers = {
-        "x-tenant-id": tenant_id,
-        "x-actor-id": actor_id,
+        "x-tenant-id": TENANT_ID,
+        "x-actor-id": ACTOR_ID,
     }
 
-    response = client.get("/protected", headers=headers)
+    response = await async_client.get("/protected", headers=headers)
 
     assert response.status_code == 403
     assert response.json()["detail"] == "Insufficient tenant role"
 
 
-def test_authorized_member_succeeds() -> None:
-    actor_id = str(uuid.uuid4())
-    tenant_id = str(uuid.uuid4())
-    member = _build_member(actor_id, tenant_id, role=TenantMemberRole.OWNER)
-    client = _create_app(member=member)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_authorized_member_succeeds(
+    async_client: httpx.AsyncClient, set_member_role: Callable[[TenantMemberRole | None], None]
+) -> None:
+    set_member_role(TenantMemberRole.OWNER)
     headers = {
-        "x-tenant-id": tenant_id,
-        "x-actor-id": actor_id,
+        "x-tenant-id": TENANT_ID,
+        "x-actor-id": ACTOR_ID,
     }
 
-    response = client.get("/protected", headers=headers)
+    response = await async_client.get("/protected", headers=headers)
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
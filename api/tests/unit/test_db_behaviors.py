@@ -1,14 +1,19 @@
-import uuid
+from contextlib import asynccontextmanager
 
 import pytest
 from sqlalchemy import select
 from src.core import db
-from src.core.context import RequestContext, reset_request_context, set_request_context
+from src.core.context import RequestContext, reset_request_context, set_request_context, tenant_context
 from src.core.exceptions import TenantContextError
 from src.models.tenant import Tenant, TenantMember, TenantMemberRole, TenantMemberStatus
+from tests.helpers import ACTOR_ID, TENANT_ID
+
+MEMBER_USER_IDS = ("00000000-0000-0000-0000-000000000003", "00000000-0000-0000-0000-000000000004")
 
 
 class _StubSession:
+    __slots__ = ("new", "deleted", "dirty", "added", "exited", "_is_modified", "rollback_called")
+
     def __init__(self, *, new=None, deleted=None, dirty=None, is_modified=True) -> None:
         self.new = new or []
         self.deleted = deleted or []
@@ -85,11 +90,10 @@ async def test_get_db_session_rolls_back_on_error(monkeypatch: pytest.MonkeyPatc
     session_context = _SessionContext()
     monkeypatch.setattr(db, "get_session_factory", lambda: session_context)
 
-    generator = db.get_db_session()
-    session = await anext(generator)
-
+    # Drive the dependency the way FastAPI does: an error in the body is thrown into it
     with pytest.raises(RuntimeError):
-        await generator.athrow(RuntimeError("failure"))
+        async with asynccontextmanager(db.get_db_session)() as session:
+            raise RuntimeError("failure")
 
     assert session.rollback_called is True
     assert session_context.exited is True
@@ -107,53 +111,42 @@ def test_inject_default_filters_require_tenant_for_scoped_queries(monkeypatch: p
 
 
 def test_apply_audit_metadata_sets_defaults() -> None:
-    tenant_id = str(uuid.uuid4())
-    user_id = str(uuid.uuid4())
-
     soft_deleted = Tenant(name="Soft", slug="soft")
     new_member = TenantMember(
-        user_id=str(uuid.uuid4()),
-        tenant_id=tenant_id,
+        user_id=MEMBER_USER_IDS[0],
+        tenant_id=TENANT_ID,
         role=TenantMemberRole.MEMBER,
         status=TenantMemberStatus.ACTIVE,
     )
     new_member.tenant_id = None
     dirty_member = TenantMember(
-        user_id=str(uuid.uuid4()),
-        tenant_id=tenant_id,
+        user_id=MEMBER_USER_IDS[1],
+        tenant_id=TENANT_ID,
         role=TenantMemberRole.MEMBER,
         status=TenantMemberStatus.ACTIVE,
     )
 
     session = _StubSession(new=[new_member], deleted=[soft_deleted], dirty=[dirty_member])
-    token = set_request_context(RequestContext(tenant_id=tenant_id, user_id=user_id))
 
-    try:
+    with tenant_context(TENANT_ID, user_id=ACTOR_ID):
         db._apply_audit_and_soft_delete_metadata(session, None, None)  # type: ignore[attr-defined]
-    finally:
-        reset_request_context(token)
 
-    assert soft_deleted.deleted_by == user_id
+    assert soft_deleted.deleted_by == ACTOR_ID
     assert soft_deleted.deleted_at is not None
-    assert new_member.tenant_id == tenant_id
-    assert new_member.created_by == user_id
-    assert new_member.updated_by == user_id
-    assert dirty_member.updated_by == user_id
+    assert new_member.tenant_id == TENANT_ID
+    assert new_member.created_by == ACTOR_ID
+    assert new_member.updated_by == ACTOR_ID
+    assert dirty_member.updated_by == ACTOR_ID
 
 
 def test_apply_audit_metadata_rejects_mismatched_tenant() -> None:
-    tenant_id = str(uuid.uuid4())
     member = TenantMember(
-        user_id=str(uuid.uuid4()),
+        user_id=MEMBER_USER_IDS[0],
         tenant_id="other",
         role=TenantMemberRole.MEMBER,
         status=TenantMemberStatus.ACTIVE,
     )
     session = _StubSession(new=[member], deleted=[], dirty=[])
-    token = set_request_context(RequestContext(tenant_id=tenant_id, user_id=str(uuid.uuid4())))
 
-    try:
-        with pytest.raises(TenantContextError):
-            db._apply_audit_and_soft_delete_metadata(session, None, None)  # type: ignore[attr-defined]
-    finally:
-        reset_request_context(token)
+    with tenant_context(TENANT_ID, user_id=ACTOR_ID), pytest.raises(TenantContextError):
+        db._apply_audit_and_soft_delete_metadata(session, None, None)  # type: ignore[attr-defined]
@@ -1,4 +1,7 @@
+import functools
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -20,7 +23,9 @@ API_REQUIRED_KEYS: set[str] = {"DATABASE_URL", "REDIS_URL"}
 WEB_REQUIRED_KEYS: set[str] = {"NEXT_PUBLIC_API_URL"}
 
 
-def parse_env_file(path: Path) -> dict[str, str]:
+@functools.cache
+def parse_env_file(path: Path) -> Mapping[str, str]:
+    """Parse an env example once per path; the read-only view keeps the cached result intact."""
     env: dict[str, str] = {}
     for index, raw_line in enumerate(path.read_text().splitlines(), start=1):
         line = raw_line.strip()
@@ -36,7 +41,7 @@ def parse_env_file(path: Path) -> dict[str, str]:
         if key in env:
             raise ValueError(f"{path}: duplicate key '{key}'")
         env[key] = value
-    return env
+    return MappingProxyType(env)
 
 
 @pytest.mark.parametrize(
@@ -1,47 +1,73 @@
 import json
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
+from typing import Any
 
 import pytest
 from fastapi import HTTPException
 from pydantic import BaseModel
 from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from src.core.config import reset_settings, reset_settings_async
+from src.core.config import get_settings
 from src.core.exceptions import TenantContextError
 from src.middleware.error_handler import ErrorHandlerMiddleware
 from starlette.requests import Request
 
+# Everything but the headers is identical across requests, so each call copies this template
+_BASE_SCOPE: dict[str, Any] = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.1"},
+    "http_version": "1.1",
+    "method": "GET",
+    "path": "/",
+    "raw_path": b"/",
+    "root_path": "",
+    "scheme": "http",
+    "query_string": b"",
+    "client": ("testserver", 80),
+    "server": ("testserver", 80),
+}
+
 
 def _make_request(headers: Mapping[str, str] | None = None) -> Request:
-    header_bytes = []
-    for key, value in (headers or {}).items():
-        header_bytes.append((key.lower().encode(), value.encode()))
-
-    scope = {
-        "type": "http",
-        "asgi": {"version": "3.0", "spec_version": "2.1"},
-        "http_version": "1.1",
-        "method": "GET",
-        "path": "/",
-        "raw_path": b"/",
-        "root_path": "",
-        "scheme": "http",
-        "query_string": b"",
-        "headers": header_bytes,
-        "client": ("testserver", 80),
-        "server": ("testserver", 80),
-    }
+    scope = _BASE_SCOPE.copy()
+    scope["headers"] = [
+        (key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in (headers or {}).items()
+    ]
     return Request(scope)
 
 
-@pytest.fixture
-def middleware(monkeypatch: pytest.MonkeyPatch) -> ErrorHandlerMiddleware:
-    monkeypatch.setenv("DEBUG", "0")
-    reset_settings()
-    return ErrorHandlerMiddleware(lambda scope, receive, send: None)
+class _Payload(BaseModel):
+    value: int
+
+
+@pytest.fixture(scope="module")
+def validation_error() -> PydanticValidationError:
+    with pytest.raises(PydanticValidationError) as exc:
+        _Payload.model_validate({"value": "bad"})
+    return exc.value
+
+
+def _build_middleware(debug: str) -> Iterator[ErrorHandlerMiddleware]:
+    """Construct the middleware under the given DEBUG value; it reads settings once in __init__."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DEBUG", debug)
+        get_settings.cache_clear()
+        yield ErrorHandlerMiddleware(lambda scope, receive, send: None)
+    # Drop the settings cached under the patched environment
+    get_settings.cache_clear()
+
 
+@pytest.fixture(scope="module")
+def middleware() -> Iterator[ErrorHandlerMiddleware]:
+    yield from _build_middleware("0")
 
-@pytest.mark.asyncio
+
+@pytest.fixture(scope="module")
+def debug_middleware() -> Iterator[ErrorHandlerMiddleware]:
+    yield from _build_middleware("1")
+
+
+@pytest.mark.asyncio(loop_scope="module")
 async def test_http_exception_translated(middleware: ErrorHandlerMiddleware) -> None:
     request = _make_request({"x-request-id": "req-123"})
     response = await middleware._handle_http_exception(request, HTTPException(status_code=404, detail="gone"))  # type: ignore[attr-defined]
@@ -52,15 +78,11 @@ async def test_http_exception_translated(middleware: ErrorHandlerMiddleware) ->
     assert body["request_id"] == "req-123"
 
 
-@pytest.mark.asyncio
-async def test_validation_errors_are_formatted(middleware: ErrorHandlerMiddleware) -> None:
-    class _Payload(BaseModel):
-        value: int
-
-    with pytest.raises(PydanticValidationError) as exc:
-        _Payload.model_validate({"value": "bad"})
-
-    response = await middleware._handle_validation_error(_make_request(), exc.value)  # type: ignore[attr-defined]
+@pytest.mark.asyncio(loop_scope="module")
+async def test_validation_errors_are_formatted(
+    middleware: ErrorHandlerMiddleware, validation_error: PydanticValidationError
+) -> None:
+    response = await middleware._handle_validation_error(_make_request(), validation_error)  # type: ignore[attr-defined]
 
     body = json.loads(response.body)
 
@@ -69,7 +91,7 @@ async def test_validation_errors_are_formatted(middleware: ErrorHandlerMiddlewar
     assert body["validation_errors"][0]["field"] == "value"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_database_errors_are_normalized(middleware: ErrorHandlerMiddleware) -> None:
     response = await middleware._handle_database_error(_make_request(), SQLAlchemyError("broken"))  # type: ignore[attr-defined]
     body = json.loads(response.body)
@@ -79,7 +101,7 @@ async def test_database_errors_are_normalized(middleware: ErrorHandlerMiddleware
     assert body["detail"] is None
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_tenant_context_error_returns_validation(middleware: ErrorHandlerMiddleware) -> None:
     response = await middleware._handle_tenant_context_error(_make_request(), TenantContextError("missing tenant"))  # type: ignore[attr-defined]
     body = json.loads(response.body)
@@ -89,15 +111,11 @@ async def test_tenant_context_error_returns_validation(middleware: ErrorHandlerM
     assert "missing tenant" in body["message"]
 
 
-@pytest.mark.asyncio
-async def test_unexpected_errors_include_detail_when_debug(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DEBUG", "1")
-    await reset_settings_async()
-    middleware = ErrorHandlerMiddleware(lambda scope, receive, send: None)
-
+@pytest.mark.asyncio(loop_scope="module")
+async def test_unexpected_errors_include_detail_when_debug(debug_middleware: ErrorHandlerMiddleware) -> None:
     request = _make_request()
     request.state.request_id = "state-id"
-    response = await middleware._handle_unexpected_error(request, ValueError("boom"))  # type: ignore[attr-defined]
+    response = await debug_middleware._handle_unexpected_error(request, ValueError("boom"))  # type: ignore[attr-defined]
     body = json.loads(response.body)
 
     assert response.status_code == 500
@@ -7,6 +7,14 @@ contracts/errors.yaml. Tests MUST fail until error models are implemented.
 
 import pytest
 from pydantic import ValidationError
+from src.models.errors import ErrorResponse, ValidationErrorResponse
+from src.models.errors import ValidationError as FieldValidationError
+
+
+@pytest.fixture(scope="module")
+def base_error() -> dict[str, str]:
+    """Canonical ErrorResponse payload; tests extend it with ``{**base_error, ...}``."""
+    return {"error": "TEST_ERROR", "message": "Test error message", "timestamp": "2025-09-23T10:30:00Z"}
 
 
 def test_error_response_model_exists() -> None:
@@ -21,14 +29,10 @@ def test_error_response_model_exists() -> None:
         pytest.fail("ErrorResponse model must exist in models.errors module")
 
 
-def test_error_response_required_fields() -> None:
+def test_error_response_required_fields(base_error: dict[str, str]) -> None:
     """Test that ErrorResponse model has all required fields."""
-    from src.models.errors import ErrorResponse
-
     # Test with all required fields
-    error_data = {"error": "TEST_ERROR", "message": "Test error message", "timestamp": "2025-09-23T10:30:00Z"}
-
-    error_response = ErrorResponse(**error_data)
+    error_response = ErrorResponse(**base_error)
 
     assert error_response.error == "TEST_ERROR"
     assert error_response.message == "Test error message"
@@ -37,8 +41,6 @@ def test_error_response_required_fields() -> None:
 
 def test_error_response_missing_required_fields() -> None:
     """Test that ErrorResponse model validates required fields."""
-    from src.models.errors import ErrorResponse
-
     # Test missing error field
     with pytest.raises(ValidationError):
         ErrorResponse(message="Test", timestamp="2025-09-23T10:30:00Z")  # type: ignore[call-arg]
@@ -52,15 +54,11 @@ def test_error_response_missing_required_fields() -> None:
         ErrorResponse(error="TEST_ERROR", message="Test")  # type: ignore[call-arg]
 
 
-def test_error_response_optional_fields() -> None:
+def test_error_response_optional_fields(base_error: dict[str, str]) -> None:
     """Test that ErrorResponse model handles optional fields correctly."""
-    from src.models.errors import ErrorResponse
-
     # Test with optional fields
     error_data = {
-        "error": "TEST_ERROR",
-        "message": "Test error message",
-        "timestamp": "2025-09-23T10:30:00Z",
+        **base_error,
         "detail": "Additional error details",
         "request_id": "550e8400-e29b-41d4-a716-446655440000",
     }
@@ -85,21 +83,18 @@ def test_validation_error_response_model_exists() -> None:
 
 def test_validation_error_response_structure() -> None:
     """Test that ValidationErrorResponse model has correct structure."""
-    from src.models.errors import ValidationError, ValidationErrorResponse
-
-    validation_errors = [
-        ValidationError(field="database_url", message="Invalid PostgreSQL connection string"),
-        ValidationError(field="timeout", message="Must be positive integer"),
-    ]
-
-    error_data = {
-        "error": "VALIDATION_ERROR",
-        "message": "Request validation failed",
-        "timestamp": "2025-09-23T10:30:00Z",
-        "validation_errors": validation_errors,
-    }
-
-    validation_response = ValidationErrorResponse(**error_data)
+    # Nested errors are passed as plain dicts and validated in one pass
+    validation_response = ValidationErrorResponse.model_validate(
+        {
+            "error": "VALIDATION_ERROR",
+            "message": "Request validation failed",
+            "timestamp": "2025-09-23T10:30:00Z",
+            "validation_errors": [
+                {"field": "database_url", "message": "Invalid PostgreSQL connection string"},
+                {"field": "timeout", "message": "Must be positive integer"},
+            ],
+        }
+    )
 
     assert validation_response.error == "VALIDATION_ERROR"
     assert len(validation_response.validation_errors) == 2
@@ -108,9 +103,7 @@ def test_validation_error_response_structure() -> None:
 
 def test_validation_error_model_structure() -> None:
     """Test that ValidationError model has correct structure."""
-    from src.models.errors import ValidationError
-
-    validation_error = ValidationError(field="database_url", message="Invalid format", value="invalid-url")
+    validation_error = FieldValidationError(field="database_url", message="Invalid format", value="invalid-url")
 
     assert validation_error.field == "database_url"
     assert validation_error.message == "Invalid format"
@@ -139,8 +132,6 @@ def test_service_unavailable_error_model() -> None:
 
 def test_error_enum_validation() -> None:
     """Test that error enums are properly validated."""
-    from src.models.errors import ValidationErrorResponse
-
     # Test that error field only accepts VALIDATION_ERROR
     with pytest.raises(ValidationError):
         ValidationErrorResponse(
@@ -148,36 +139,28 @@ def test_error_enum_validation() -> None:
         )
 
 
-def test_timestamp_format_validation() -> None:
+def test_timestamp_format_validation(base_error: dict[str, str]) -> None:
     """Test that timestamp format is properly validated."""
-    from src.models.errors import ErrorResponse
-
     # Test with valid ISO 8601 timestamp
     valid_timestamps = ["2025-09-23T10:30:00Z", "2025-09-23T10:30:00.123Z", "2025-09-23T10:30:00+00:00"]
 
     for timestamp in valid_timestamps:
-        error_response = ErrorResponse(error="TEST_ERROR", message="Test", timestamp=timestamp)
+        error_response = ErrorResponse(**{**base_error, "timestamp": timestamp})
         assert error_response.timestamp == timestamp
 
 
-def test_request_id_uuid_validation() -> None:
+def test_request_id_uuid_validation(base_error: dict[str, str]) -> None:
     """Test that request_id follows UUID format if validated."""
-    from src.models.errors import ErrorResponse
-
     # Test with valid UUID
     valid_uuid = "550e8400-e29b-41d4-a716-446655440000"
 
-    error_response = ErrorResponse(
-        error="TEST_ERROR", message="Test", timestamp="2025-09-23T10:30:00Z", request_id=valid_uuid
-    )
+    error_response = ErrorResponse(**base_error, request_id=valid_uuid)
 
     assert error_response.request_id == valid_uuid
 
 
 def test_error_response_serialization() -> None:
     """Test that error responses can be serialized to JSON correctly."""
-    from src.models.errors import ErrorResponse
-
     error_response = ErrorResponse(
         error="DATABASE_CONNECTION_ERROR",
         message="Unable to connect to database",
@@ -197,19 +180,17 @@ def test_error_response_serialization() -> None:
 
 def test_validation_error_nested_structure() -> None:
     """Test that validation errors handle nested structure correctly."""
-    from src.models.errors import ValidationError, ValidationErrorResponse
-
     # Test with multiple validation errors
-    validation_errors = [
-        ValidationError(field="config.database_url", message="Required field missing"),
-        ValidationError(field="config.pool_size", message="Must be positive", value=-1),
-    ]
-
-    validation_response = ValidationErrorResponse(
-        error="VALIDATION_ERROR",
-        message="Configuration validation failed",
-        timestamp="2025-09-23T10:30:00Z",
-        validation_errors=validation_errors,
+    validation_response = ValidationErrorResponse.model_validate(
+        {
+            "error": "VALIDATION_ERROR",
+            "message": "Configuration validation failed",
+            "timestamp": "2025-09-23T10:30:00Z",
+            "validation_errors": [
+                {"field": "config.database_url", "message": "Required field missing"},
+                {"field": "config.pool_size", "message": "Must be positive", "value": -1},
+            ],
+        }
     )
 
     serialized = validation_response.model_dump()
@@ -219,11 +200,9 @@ def test_validation_error_nested_structure() -> None:
     assert serialized["validation_errors"][1]["value"] == -1
 
 
-def test_error_models_immutability() -> None:
+def test_error_models_immutability(base_error: dict[str, str]) -> None:
     """Test that error models are immutable if configured as frozen."""
-    from src.models.errors import ErrorResponse
-
-    error_response = ErrorResponse(error="TEST_ERROR", message="Test", timestamp="2025-09-23T10:30:00Z")
+    error_response = ErrorResponse(**base_error)
 
     # If frozen=True is configured, this should raise an error
     try:
@@ -10,7 +10,7 @@ def test_find_project_root_returns_none_for_missing_marker() -> None:
     assert health._find_project_root(marker="does-not-exist.txt") is None  # type: ignore[attr-defined]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_application_health_reports_missing_config(monkeypatch: pytest.MonkeyPatch) -> None:
     settings = SimpleNamespace(app_name="", app_version="")
     monkeypatch.setattr(health, "get_settings", lambda: settings)
@@ -22,7 +22,7 @@ async def test_application_health_reports_missing_config(monkeypatch: pytest.Mon
     assert body["errors"]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_application_health_handles_unexpected_error(monkeypatch: pytest.MonkeyPatch) -> None:
     def _raise() -> None:
         raise ValueError("boom")
@@ -36,7 +36,7 @@ async def test_application_health_handles_unexpected_error(monkeypatch: pytest.M
     assert any("boom" in error for error in body["errors"])
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_database_health_handles_connection_failure(monkeypatch: pytest.MonkeyPatch) -> None:
     async def _fail_connection() -> bool:
         return False
@@ -50,7 +50,7 @@ async def test_database_health_handles_connection_failure(monkeypatch: pytest.Mo
     assert "Database connection failed" in body["errors"][0]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_database_health_handles_info_error(monkeypatch: pytest.MonkeyPatch) -> None:
     async def _connected() -> bool:
         return True
@@ -68,7 +68,7 @@ async def test_database_health_handles_info_error(monkeypatch: pytest.MonkeyPatc
     assert "boom" in body["errors"][0]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_migration_status_returns_unknown_when_config_missing(monkeypatch: pytest.MonkeyPatch) -> None:
     def _missing_config():
         raise FileNotFoundError()
@@ -80,7 +80,7 @@ async def test_get_migration_status_returns_unknown_when_config_missing(monkeypa
     assert status == MigrationStatus.UNKNOWN
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_redis_health_handles_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     settings = SimpleNamespace(redis_health_check_timeout=0.1)
     monkeypatch.setattr(health, "get_settings", lambda: settings)
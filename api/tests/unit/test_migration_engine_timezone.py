@@ -1,11 +1,13 @@
-import asyncio
 import importlib
 import sys
+from collections.abc import Iterator
 from contextlib import nullcontext
 from types import ModuleType, SimpleNamespace
 
+import pytest
 
-def _stub_alembic_modules(monkeypatch) -> None:
+
+def _stub_alembic_modules(monkeypatch: pytest.MonkeyPatch) -> None:
     ctx_module = ModuleType("alembic.context")
     ctx_config = SimpleNamespace(
         config_file_name=None,
@@ -25,6 +27,14 @@ def _stub_alembic_modules(monkeypatch) -> None:
     monkeypatch.setitem(sys.modules, "alembic.context", ctx_module)
 
 
+@pytest.fixture(scope="module")
+def alembic_env() -> Iterator[ModuleType]:
+    """Import migrations.env once against the stubbed alembic modules."""
+    with pytest.MonkeyPatch.context() as mp:
+        _stub_alembic_modules(mp)
+        yield importlib.import_module("migrations.env")
+
+
 class _FakeConnection:
     async def __aenter__(self):
         return self
@@ -47,9 +57,9 @@ class _FakeEngine:
         return None
 
 
-def test_migration_engine_uses_utc_timezone(monkeypatch) -> None:
-    _stub_alembic_modules(monkeypatch)
-    env = importlib.import_module("migrations.env")
+@pytest.mark.asyncio(loop_scope="module")
+async def test_migration_engine_uses_utc_timezone(alembic_env: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    env = alembic_env
 
     captured: dict[str, object] = {}
 
@@ -69,7 +79,7 @@ def test_migration_engine_uses_utc_timezone(monkeypatch) -> None:
         ),
     )
 
-    asyncio.run(env.run_async_migrations())
+    await env.run_async_migrations()
 
     server_settings = captured["kwargs"]["connect_args"]["server_settings"]  # type: ignore[index]
     assert server_settings["TimeZone"] == "UTC"  # type: ignore[index]
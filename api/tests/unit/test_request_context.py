@@ -2,6 +2,9 @@
 Unit tests for request context helpers.
 """
 
+from collections.abc import Generator
+
+import pytest
 from src.core.context import (
     RequestContext,
     get_request_context,
@@ -12,9 +15,16 @@ from src.core.context import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clean_request_context() -> Generator[None, None, None]:
+    """Start and finish every test with an empty request context."""
+    reset_request_context()
+    yield
+    reset_request_context()
+
+
 def test_tenant_context_sets_expected_fields() -> None:
     """Ensure tenant_context helper applies fields to the context var."""
-    reset_request_context()
     assert get_request_context() == RequestContext()
 
     with tenant_context("tenant-123", user_id="user-456"):
@@ -29,8 +39,6 @@ def test_tenant_context_sets_expected_fields() -> None:
 
 def test_include_soft_deleted_toggles_flag() -> None:
     """include_soft_deleted should temporarily allow querying deleted rows."""
-    reset_request_context()
-
     with tenant_context("tenant-1"):
         assert not get_request_context().include_deleted
         with include_soft_deleted():
@@ -40,8 +48,6 @@ def test_include_soft_deleted_toggles_flag() -> None:
 
 def test_system_context_enables_global_access() -> None:
     """system_context should bypass tenant filtering while restoring afterwards."""
-    reset_request_context()
-
     with system_context(user_id="system"):
         ctx = get_request_context()
         assert ctx.allow_global_access
@@ -1,4 +1,6 @@
-import uuid
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import APIRouter, FastAPI, HTTPException
@@ -11,27 +13,12 @@ from src.core.router import (
     tenant_router,
 )
 from src.models.tenant import Tenant, TenantMember, TenantMemberRole, TenantMemberStatus
-
-
-class _StubResult:
-    def __init__(self, member: TenantMember | None) -> None:
-        self._member = member
-
-    def scalar_one_or_none(self) -> TenantMember | None:
-        return self._member
-
-
-class _StubSession:
-    def __init__(self, member: TenantMember | None) -> None:
-        self._member = member
-
-    async def execute(self, _statement: object) -> _StubResult:
-        return _StubResult(self._member)
+from tests.helpers import ACTOR_ID, TENANT_ID
 
 
 def _build_tenant() -> Tenant:
     tenant = Tenant(name="Test Tenant", slug="test-tenant")
-    tenant.id = str(uuid.uuid4())
+    tenant.id = TENANT_ID
     return tenant
 
 
@@ -50,64 +37,66 @@ def test_public_router_normalizes_tags() -> None:
     assert router.tags == ["one", "two"]
 
 
-@pytest.mark.asyncio
-async def test_tenant_router_applies_membership_dependency() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tenant_router_applies_membership_dependency(stub_session_factory: Callable[[Any], AsyncMock]) -> None:
     tenant = _build_tenant()
-    actor_id = str(uuid.uuid4())
-    member = _build_member(actor_id, tenant.id, TenantMemberRole.MEMBER)
+    member = _build_member(ACTOR_ID, tenant.id, TenantMemberRole.MEMBER)
     router = tenant_router("/items")
     dependency = router.dependencies[0].dependency
-    token = set_request_context(RequestContext(tenant_id=tenant.id, user_id=actor_id))
+    token = set_request_context(RequestContext(tenant_id=tenant.id, user_id=ACTOR_ID))
 
     try:
-        resolved = await dependency(session=_StubSession(member), tenant=tenant)
+        resolved = await dependency(session=stub_session_factory(member), tenant=tenant)
     finally:
         reset_request_context(token)
 
     assert resolved is member
 
 
-@pytest.mark.asyncio
-async def test_admin_router_enforces_admin_roles() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_admin_router_enforces_admin_roles(stub_session_factory: Callable[[Any], AsyncMock]) -> None:
     tenant = _build_tenant()
-    actor_id = str(uuid.uuid4())
-    member = _build_member(actor_id, tenant.id, TenantMemberRole.MEMBER)
+    member = _build_member(ACTOR_ID, tenant.id, TenantMemberRole.MEMBER)
     router = admin_router("/admin")
     dependency = router.dependencies[0].dependency
-    token = set_request_context(RequestContext(tenant_id=tenant.id, user_id=actor_id))
+    token = set_request_context(RequestContext(tenant_id=tenant.id, user_id=ACTOR_ID))
 
     try:
         with pytest.raises(HTTPException) as exc:
-            await dependency(session=_StubSession(member), tenant=tenant)
+            await dependency(session=stub_session_factory(member), tenant=tenant)
     finally:
         reset_request_context(token)
 
     assert exc.value.status_code == 403
 
 
-def test_include_tenant_router_attaches_dependency() -> None:
+@pytest.fixture(scope="module")
+def app_with_routers() -> FastAPI:
+    """One app carrying a tenant router at /ping and an admin router at /secure."""
     app = FastAPI()
-    router = APIRouter()
+    tenant = APIRouter()
+    admin = APIRouter()
 
-    @router.get("/ping")
+    @tenant.get("/ping")
     async def ping() -> dict[str, bool]:
         return {"ok": True}
 
-    include_tenant_router(app, router)
-    route = next(r for r in app.routes if getattr(r, "path", "") == "/ping")
+    @admin.get("/secure")
+    async def secure() -> dict[str, bool]:
+        return {"ok": True}
+
+    include_tenant_router(app, tenant)
+    include_admin_router(app, admin)
+    return app
 
-    assert route.dependencies, "Tenant enforcement dependency should be attached"
 
+def test_include_tenant_router_attaches_dependency(app_with_routers: FastAPI) -> None:
+    route = next(r for r in app_with_routers.routes if getattr(r, "path", "") == "/ping")
 
-def test_include_admin_router_attaches_dependency() -> None:
-    app = FastAPI()
-    router = APIRouter()
+    assert route.dependencies, "Tenant enforcement dependency should be attached"
 
-    @router.get("/secure")
-    async def secure() -> dict[str, bool]:
-        return {"ok": True}
 
-    include_admin_router(app, router)
-    route = next(r for r in app.routes if getattr(r, "path", "") == "/secure")
+def test_include_admin_router_attaches_dependency(app_with_routers: FastAPI) -> None:
+    route = next(r for r in app_with_routers.routes if getattr(r, "path", "") == "/secure")
 
     assert route.dependencies, "Admin enforcement dependency should be attached"
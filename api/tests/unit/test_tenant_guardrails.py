@@ -5,6 +5,7 @@ Guardrail tests to keep tenant isolation and routing conventions enforced.
 import importlib
 import pkgutil
 
+import pytest
 from fastapi import APIRouter
 from src.models.base import Base, TenantAwareMixin
 from src.models.tenant import Tenant
@@ -15,44 +16,43 @@ def test_models_are_tenant_scoped_by_default() -> None:
     Ensure new models inherit TenantAwareMixin unless explicitly whitelisted.
     """
     allowed_global_models = {Tenant}
-    missing_mixin: list[str] = []
-
-    for mapper in Base.registry.mappers:
-        model_cls = mapper.class_
-        if model_cls in allowed_global_models:
-            continue
-        if not issubclass(model_cls, TenantAwareMixin):
-            missing_mixin.append(model_cls.__name__)
+    # Read the registry when the test runs so models imported during collection are included
+    missing_mixin = [
+        mapper.class_.__name__
+        for mapper in Base.registry.mappers
+        if mapper.class_ not in allowed_global_models and not issubclass(mapper.class_, TenantAwareMixin)
+    ]
 
     assert not missing_mixin, (
         f"Models must inherit TenantAwareMixin or be whitelisted as global: {sorted(missing_mixin)}"
     )
 
 
-def test_endpoint_routers_enforce_tenant_dependencies() -> None:
-    """
-    Ensure routers are created with tenant-aware dependencies by default.
-    """
+@pytest.fixture(scope="session")
+def endpoint_routers() -> list[tuple[str, APIRouter]]:
+    """Import every endpoint module once and collect the routers they export."""
     import src.api.endpoints as endpoints_pkg
 
-    public_prefixes = {"/health", "/branding"}
-    violations: list[str] = []
-
+    routers: list[tuple[str, APIRouter]] = []
     for module_info in pkgutil.iter_modules(endpoints_pkg.__path__):
         if module_info.name.startswith("_"):
             continue
 
         module = importlib.import_module(f"{endpoints_pkg.__name__}.{module_info.name}")
         router = getattr(module, "router", None)
+        if isinstance(router, APIRouter):
+            routers.append((module_info.name, router))
+    return routers
 
-        if not isinstance(router, APIRouter):
-            continue
-
-        if router.prefix in public_prefixes:
-            continue
 
-        if not router.dependencies:
-            violations.append(module_info.name)
+def test_endpoint_routers_enforce_tenant_dependencies(endpoint_routers: list[tuple[str, APIRouter]]) -> None:
+    """
+    Ensure routers are created with tenant-aware dependencies by default.
+    """
+    public_prefixes = {"/health", "/branding"}
+    violations = [
+        name for name, router in endpoint_routers if router.prefix not in public_prefixes and not router.dependencies
+    ]
 
     assert not violations, (
         "Routers must enforce tenant membership/roles (use tenant_router/admin_router). "